@@ -0,0 +1,20 @@
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    Mixin for ModelSerializer subclasses that builds the field map once per class.
+
+    ModelSerializer introspects the model and Meta options every time it is
+    instantiated. The result only depends on the class, so it is computed on
+    first use and deep-copied for each instance afterwards, which gives every
+    serializer its own unbound field objects.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return copy.deepcopy(cached)
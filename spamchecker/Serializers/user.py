@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import User
+from .mixins import CachedFieldsMixin
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the User model.
     """
@@ -20,18 +21,24 @@ class UserSerializer(serializers.ModelSerializer):
             'email': {'error_messages': {'required': 'Email is required.', 'invalid': 'Enter a valid email address.'}},
         }
 
-    def validate_phone_number(self, value):
-        """
-        Custom validation logic for phone_number.
-        """
-        if not value.isdigit():
-            raise serializers.ValidationError('Phone number must be numeric.')
-        return value
-
     def validate_email(self, value):
         """
         Custom validation logic for email.
         """
-        if '@example.com' in value:
+        if value and value.lower().endswith('@example.com'):
             raise serializers.ValidationError('Email addresses from example.com are not allowed.')
         return value
+
+class UserRegistrationSerializer(UserSerializer):
+    """
+    Serializer for registering a User.
+
+    Accepts an already-hashed password in addition to the profile fields.
+    Profile updates keep using UserSerializer, so they cannot set it.
+    """
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ['password']
+        extra_kwargs = {
+            **UserSerializer.Meta.extra_kwargs,
+            'password': {'write_only': True},
+        }
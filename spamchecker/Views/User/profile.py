@@ -2,8 +2,17 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from ...models import User
 from ...Serializers.user import UserSerializer
+from ..errors import format_serializer_errors
+
+# Fields rendered by GET; kept in sync with the serializer used for updates
+_USER_FIELDS = tuple(UserSerializer.Meta.fields)
+
+def _profile_data(user):
+    """
+    Build the profile representation directly from the user's attributes.
+    """
+    return {field: getattr(user, field) for field in _USER_FIELDS}
 
 class UserProfileAPIView(APIView):
     """
@@ -23,8 +32,8 @@ class UserProfileAPIView(APIView):
         Fetch the logged-in user's profile.
         """
         user = request.user
-        serializer = UserSerializer(user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Plain attribute reads; no validation is needed on the read path
+        return Response(_profile_data(user), status=status.HTTP_200_OK)
 
     def patch(self, request):
         """
@@ -34,28 +43,14 @@ class UserProfileAPIView(APIView):
         serializer = UserSerializer(user, data=request.data, partial=True)
 
         if serializer.is_valid():
-            serializer.save()
+            user = serializer.save()
             return Response(
-                {"message": "Profile updated successfully.", "data": serializer.data},
+                {"message": "Profile updated successfully.", "data": _profile_data(user)},
                 status=status.HTTP_200_OK
             )
 
-        errors = self.format_serializer_errors(serializer.errors)
+        errors = format_serializer_errors(serializer.errors)
         return Response(
             {"error": "Validation failed.", "details": errors},
             status=status.HTTP_400_BAD_REQUEST
         )
-
-    def format_serializer_errors(self, errors):
-        """
-        Custom method to format error messages from serializer.
-        
-        Args:
-            errors (dict): Serializer errors.
-        
-        Returns:
-            dict: Custom error messages for each field.
-        """
-        formatted_errors = {}
-        for field, error_list in errors.items():
-            formatted_errors[field] = error_list[0]  #
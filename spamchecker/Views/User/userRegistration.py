@@ -2,8 +2,25 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError
+from django.http import QueryDict
 from ...models import User
-from ...Serializers.user import UserSerializer
+from ...Serializers.user import UserRegistrationSerializer
+from ..errors import format_serializer_errors
+
+DUPLICATE_PHONE_NUMBER_ERROR = "A user with this phone number already exists."
+
+def _is_duplicate_phone_number(errors):
+    """
+    Check whether serializer errors include a failed phone number uniqueness check.
+
+    Args:
+        errors (dict): Serializer errors.
+
+    Returns:
+        bool: True if the phone number is already registered.
+    """
+    return any(error.code == 'unique' for error in errors.get('phone_number', []))
 
 class UserRegistrationAPIView(APIView):
     """
@@ -11,47 +28,44 @@ class UserRegistrationAPIView(APIView):
     """
 
     def post(self, request):
-        # Extract and copy request data to make it mutable
-        data = request.data.copy()
-        
-        # Check if the phone number exists
-        phone_number = data.get('phone_number')
-        if User.objects.filter(phone_number=phone_number).exists():
-            return Response(
-                {"error": "A user with this phone number already exists."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        # Take a shallow, mutable copy of the request data. QueryDict.copy()
+        # deep-copies every value list, so form data is flattened instead.
+        if isinstance(request.data, QueryDict):
+            data = request.data.dict()
+        else:
+            data = dict(request.data)
 
         # Encrypt the password
         data['password'] = make_password(data.get('password'))
         
         # Pass the data to the serializer
-        serializer = UserSerializer(data=data)
+        serializer = UserRegistrationSerializer(data=data)
         
         if serializer.is_valid():
-            serializer.save()
+            # A concurrent registration can still pass validation; the
+            # unique constraint on phone_number is the final check
+            try:
+                serializer.save()
+            except IntegrityError:
+                phone_number = serializer.validated_data['phone_number']
+                if not User.objects.filter(phone_number=phone_number).exists():
+                    raise
+                return Response(
+                    {"error": DUPLICATE_PHONE_NUMBER_ERROR},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(
                 {"message": "User registered successfully."},
                 status=status.HTTP_201_CREATED,
             )
+        elif _is_duplicate_phone_number(serializer.errors):
+            return Response(
+                {"error": DUPLICATE_PHONE_NUMBER_ERROR},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         else:
-            errors = self.format_serializer_errors(serializer.errors)
+            errors = format_serializer_errors(serializer.errors)
             return Response(
                 {"error": "Validation failed.", "details": errors},
                 status=status.HTTP_400_BAD_REQUEST
             )
-
-    def format_serializer_errors(self, errors):
-        """
-        Custom method to format error messages from serializer.
-        
-        Args:
-            errors (dict): Serializer errors.
-        
-        Returns:
-            dict: Custom error messages for each field.
-        """
-        formatted_errors = {}
-        for field, error_list in errors.items():
-            formatted_errors[field] = error_list[0]  # Return only the first error message for each field
-        return formatted_errors
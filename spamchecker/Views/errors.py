@@ -0,0 +1,11 @@
+def format_serializer_errors(errors):
+    """
+    Format error messages from a serializer.
+
+    Args:
+        errors (dict): Serializer errors.
+
+    Returns:
+        dict: The first error message for each field.
+    """
+    return {field: error_list[0] for field, error_list in errors.items()}
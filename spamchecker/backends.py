@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from .Serializers.user import UserSerializer
+
+UserModel = get_user_model()
+
+# Columns loaded for the authenticated user on every request: the profile
+# fields, plus the password hash that session authentication verifies.
+_AUTH_USER_FIELDS = (*UserSerializer.Meta.fields, 'password')
+
+class UserModelBackend(ModelBackend):
+    """
+    Authentication backend that loads only the columns the API uses.
+
+    Methods:
+        get_user(user_id): Fetches the user for the current session.
+    """
+    def get_user(self, user_id):
+        """
+        Fetch the user with deferred loading of unused columns.
+
+        Args:
+            user_id: The primary key stored in the session.
+
+        Returns:
+            User: The user instance, or None if it does not exist or is inactive.
+        """
+        try:
+            user = UserModel._default_manager.only(*_AUTH_USER_FIELDS).get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -12,6 +12,12 @@ class Migration(migrations.Migration):
         ('spamchecker', '0001_initial'),
     ]
 
+    # Swappable dependencies on AUTH_USER_MODEL resolve to 0001_initial, which
+    # is empty; the User model must exist before admin's LogEntry references it.
+    run_before = [
+        ('admin', '0001_initial'),
+    ]
+
     operations = [
         migrations.CreateModel(
             name='User',
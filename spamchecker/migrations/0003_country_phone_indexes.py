@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-15 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('spamchecker', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='globalcontact',
+            index=models.Index(fields=['country_code', 'phone_number'], name='spamchecker_country_16694d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['country_code', 'phone_number'], name='spamchecker_country_efa6cd_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:10
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('spamchecker', '0003_country_phone_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(max_length=15, unique=True, validators=[django.core.validators.RegexValidator('^[0-9]{1,15}\\Z', 'Phone number must be numeric.')]),
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
-from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
+from django.db import models, router, transaction
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
+from django.core.validators import RegexValidator
+
+# Phone numbers are stored as 1-15 ASCII digits, without the country code
+phone_number_validator = RegexValidator(r'^[0-9]{1,15}\Z', 'Phone number must be numeric.')
 
 class CustomUserManager(BaseUserManager):
     """
@@ -11,6 +16,9 @@ class CustomUserManager(BaseUserManager):
         
         create_superuser(phone_number, password, **extra_fields):
             Creates and returns a superuser with elevated permissions.
+
+        bulk_register(users_data, batch_size=500):
+            Creates many users and their GlobalContact entries in bulk.
     """
     def create_user(self, phone_number, password=None, **extra_fields):
         """
@@ -50,7 +58,56 @@ class CustomUserManager(BaseUserManager):
         extra_fields.setdefault('is_superuser', True)  # Superusers have all permissions
         return self.create_user(phone_number, password, **extra_fields)
 
-class User(AbstractBaseUser):
+    def bulk_register(self, users_data, batch_size=500):
+        """
+        Create many users at once and sync them into GlobalContact.
+
+        Unlike create_user, this bypasses User.save(), so the GlobalContact
+        rows are upserted with a single bulk statement instead of one per user.
+
+        Args:
+            users_data (iterable of dict): Field values for each user, including
+                'phone_number' and an optional raw 'password'.
+            batch_size (int, optional): Number of rows sent per INSERT.
+
+        Returns:
+            list[User]: The created user instances.
+
+        Raises:
+            ValueError: If a phone number is not provided.
+        """
+        users = []
+        for data in users_data:
+            data = dict(data)
+            if not data.get('phone_number'):
+                raise ValueError('The Phone Number must be set')
+            data['password'] = make_password(data.get('password'))
+            users.append(self.model(**data))
+
+        with transaction.atomic(using=self._db):
+            users = self.bulk_create(users, batch_size=batch_size)
+            GlobalContact.objects.using(self._db).bulk_create(
+                [
+                    GlobalContact(
+                        phone_number=user.phone_number,
+                        name=f"{user.first_name} {user.last_name}",
+                        is_registered_user=True,
+                        country_code=user.country_code,
+                        email=user.email,
+                        user=user,
+                    )
+                    for user in users
+                ],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['phone_number'],
+                update_fields=[
+                    'name', 'is_registered_user', 'country_code', 'email', 'user', 'last_updated',
+                ],
+            )
+        return users
+
+class User(AbstractBaseUser, PermissionsMixin):
     """
     Custom user model where phone number is the unique identifier instead of a username.
 
@@ -64,47 +121,54 @@ class User(AbstractBaseUser):
         email (EmailField): The email of the user (optional).
         password (CharField): The encrypted password of the user.
         date_joined (DateTimeField): The date and time when the user registered.
+        is_staff (BooleanField): Whether the user can log into the admin site.
+
+    Superuser status, groups and permissions come from PermissionsMixin.
     """
     salutation = models.CharField(max_length=10, blank=True, null=True)
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
     occupation = models.CharField(max_length=100, blank=True, null=True)
-    phone_number = models.CharField(max_length=15, unique=True)
+    phone_number = models.CharField(max_length=15, unique=True, validators=[phone_number_validator])
     country_code = models.CharField(max_length=5)
     email = models.EmailField(blank=True, null=True)
     password = models.CharField(max_length=255)
     date_joined = models.DateTimeField(auto_now_add=True)
+    is_staff = models.BooleanField(default=False)
 
     USERNAME_FIELD = 'phone_number'
     REQUIRED_FIELDS = ['first_name', 'last_name']
 
     objects = CustomUserManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['country_code', 'phone_number']),
+        ]
+
     def save(self, *args, **kwargs):
         """
         Ensure that the user's information is also stored in GlobalContact.
 
+        The user write and the GlobalContact sync run in a single transaction.
+
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
-        super().save(*args, **kwargs)
-        global_contact, created = GlobalContact.objects.get_or_create(
-            phone_number=self.phone_number,
-            defaults={
-                'name': f"{self.first_name} {self.last_name}",
-                'is_registered_user': True,
-                'country_code': self.country_code,
-                'email': self.email
-            }
-        )
-        if not created:
-            global_contact.name = f"{self.first_name} {self.last_name}"
-            global_contact.is_registered_user = True
-            global_contact.country_code = self.country_code
-            global_contact.email = self.email
-            global_contact.user = self  # Link the User to the GlobalContact
-            global_contact.save()
+        using = kwargs.get('using') or router.db_for_write(self.__class__, instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+            GlobalContact.objects.using(using).update_or_create(
+                phone_number=self.phone_number,
+                defaults={
+                    'name': f"{self.first_name} {self.last_name}",
+                    'is_registered_user': True,
+                    'country_code': self.country_code,
+                    'email': self.email,
+                    'user': self,  # Link the User to the GlobalContact
+                }
+            )
 
     def set_password(self, raw_password):
         """
@@ -143,6 +207,11 @@ class GlobalContact(models.Model):
     last_updated = models.DateTimeField(auto_now=True)
     user = models.ForeignKey('User', on_delete=models.SET_NULL, null=True, blank=True, related_name='global_contacts')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['country_code', 'phone_number']),
+        ]
+
     def spam_likelihood(self):
         """
         Calculate the spam likelihood of this number.
@@ -0,0 +1,37 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_fallback_encoder = JSONEncoder()
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Types orjson does not handle natively (lazy translation strings, Decimal,
+    querysets, ...) fall back to DRF's JSONEncoder. Datetimes are passed
+    through to it as well so they keep DRF's ISO 8601 format. Non-str dict
+    keys are stringified as json.dumps does.
+
+    Differences from JSONRenderer:
+        - NaN and Infinity are rendered as null instead of raising, so
+          STRICT_JSON is not enforced.
+        - Requests for indented output (e.g. `application/json; indent=4`)
+          are rendered by JSONRenderer.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON bytes.
+        """
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(
+            data,
+            default=_fallback_encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # Escape U+2028 and U+2029 as JSONRenderer does, so the output stays
+        # a strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -90,6 +90,17 @@ DATABASES = {
 }
 
 
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    # JSON only; the browsable API renderer rebuilds serializer forms per request
+    'DEFAULT_RENDERER_CLASSES': [
+        'spamchecker.renderers.ORJSONRenderer',
+    ],
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -109,6 +120,25 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+AUTH_USER_MODEL = 'spamchecker.User'
+
+AUTHENTICATION_BACKENDS = [
+    'spamchecker.backends.UserModelBackend',
+]
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.1/topics/auth/passwords/#using-argon2-with-django
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
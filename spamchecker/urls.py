@@ -2,7 +2,10 @@ from django.urls import path
 from .Views.User.profile import  UserProfileAPIView
 from .Views.User.userRegistration import UserRegistrationAPIView
 
+_register_view = UserRegistrationAPIView.as_view()
+_profile_view = UserProfileAPIView.as_view()
+
 urlpatterns = [
-    path('register/', UserRegistrationAPIView.as_view(), name='user-register'),
-    path('profile/', UserProfileAPIView.as_view(), name='user-profile'),
+    path('register/', _register_view, name='user-register'),
+    path('profile/', _profile_view, name='user-profile'),
 ]